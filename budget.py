@@ -10,6 +10,8 @@ from . import config
 class BudgetManager:
     """Manages daily budget tracking"""
     
+    __slots__ = ('_daily_budget', '_remaining_budget', '_total_spent')
+    
     def __init__(self, daily_budget: float = config.DAILY_BUDGET):
         self._daily_budget = daily_budget
         self._remaining_budget = daily_budget
@@ -37,13 +39,29 @@ class BudgetManager:
         Returns:
             True if successful, False if insufficient budget
         """
-        if not self.can_afford(cost):
+        return self.try_deduct(cost)
+    
+    def try_deduct(self, cost: float) -> bool:
+        """
+        Check affordability and deduct in one step
+        
+        Args:
+            cost: Amount to deduct
+            
+        Returns:
+            True if deducted, False if insufficient budget (nothing changes)
+        """
+        if self._remaining_budget < cost:
             return False
         
         self._remaining_budget -= cost
         self._total_spent += cost
         return True
     
+    def get_remaining(self) -> float:
+        """Get remaining budget without building the full stats dict"""
+        return self._remaining_budget
+    
     def get_stats(self) -> Dict:
         """Get budget statistics"""
         percentage = (self._total_spent / self._daily_budget * 100) if self._daily_budget > 0 else 0
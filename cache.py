@@ -1,27 +1,44 @@
 """
 Cache Module
-Simple in-memory cache with MD5 hashing
+Two-tier bounded in-memory LRU cache keyed directly on the prompt string
 """
 
-import hashlib
+import time
+from collections import OrderedDict
 from typing import Dict, Optional
-from datetime import datetime
+
+from . import config
 
 
 class CacheManager:
-    """Manages response caching with in-memory storage"""
+    """
+    Manages response caching with bounded in-memory LRU storage
+    
+    A small hot tier (L1) of the most recently used entries sits in front
+    of the main LRU so repeat prompts are served from a compact dict. L1
+    only ever holds entries that are also in the main tier, so
+    max_entries bounds what the cache serves.
+    """
+    
+    __slots__ = (
+        '_cache', '_max_entries', '_l1', '_l1_entries',
+        '_hits', '_misses', '_tokens_saved', '_cost_saved',
+    )
     
-    def __init__(self):
-        self._cache: Dict[str, Dict] = {}
+    def __init__(
+        self,
+        max_entries: int = config.MAX_CACHE_ENTRIES,
+        l1_entries: int = config.L1_CACHE_ENTRIES,
+    ):
+        self._cache: "OrderedDict[str, Dict]" = OrderedDict()
+        self._max_entries = max_entries
+        self._l1: "OrderedDict[str, Dict]" = OrderedDict()
+        self._l1_entries = l1_entries
         self._hits = 0
         self._misses = 0
         self._tokens_saved = 0
         self._cost_saved = 0.0
     
-    def _hash_prompt(self, prompt: str) -> str:
-        """Generate hash key for prompt"""
-        return hashlib.md5(prompt.encode()).hexdigest()
-    
     def get(self, prompt: str) -> Optional[Dict]:
         """
         Check if prompt exists in cache
@@ -32,11 +49,19 @@ class CacheManager:
         Returns:
             Cached data dict or None
         """
-        key = self._hash_prompt(prompt)
+        cached = self._l1.get(prompt)
+        
+        if cached is not None:
+            self._l1.move_to_end(prompt)
+            self._cache.move_to_end(prompt)
+        else:
+            cached = self._cache.get(prompt)
+            if cached is not None:
+                self._cache.move_to_end(prompt)
+                self._promote(prompt, cached)
         
-        if key in self._cache:
+        if cached is not None:
             self._hits += 1
-            cached = self._cache[key]
             self._tokens_saved += cached['tokens']
             self._cost_saved += cached['cost']
             return cached
@@ -46,7 +71,7 @@ class CacheManager:
     
     def set(self, prompt: str, tokens: int, model: str, cost: float):
         """
-        Store prompt result in cache
+        Store prompt result in cache, evicting least recently used entries
         
         Args:
             prompt: Input prompt
@@ -54,13 +79,33 @@ class CacheManager:
             model: Model used
             cost: Cost incurred
         """
-        key = self._hash_prompt(prompt)
-        self._cache[key] = {
+        entry = {
             'tokens': tokens,
             'model': model,
             'cost': cost,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': time.time()
         }
+        self._cache[prompt] = entry
+        
+        while len(self._cache) > self._max_entries:
+            evicted, _ = self._cache.popitem(last=False)
+            self._l1.pop(evicted, None)
+        
+        # With max_entries=0 the entry is evicted immediately; keep L1 a subset
+        if prompt in self._cache:
+            self._promote(prompt, entry)
+    
+    def _promote(self, prompt: str, entry: Dict):
+        """Insert entry into the hot tier, evicting its oldest entries"""
+        self._l1[prompt] = entry
+        self._l1.move_to_end(prompt)
+        
+        while len(self._l1) > self._l1_entries:
+            self._l1.popitem(last=False)
+    
+    def get_cost_saved(self) -> float:
+        """Get total cost saved without building the full stats dict"""
+        return self._cost_saved
     
     def get_stats(self) -> Dict:
         """Get cache statistics"""
@@ -75,6 +120,7 @@ class CacheManager:
     def clear(self):
         """Clear all cache data"""
         self._cache.clear()
+        self._l1.clear()
         self._hits = 0
         self._misses = 0
         self._tokens_saved = 0
@@ -3,22 +3,38 @@ Configuration Module
 Contains all costs, limits, and thresholds for the routing engine
 """
 
+from dataclasses import dataclass
+from enum import IntEnum
+
+
+@dataclass(frozen=True, slots=True)
+class ModelConfig:
+    """Static pricing and routing details for a model"""
+    name: str
+    cost_per_1k: float
+    type: str
+
+
 # Model configurations
-CHEAP_MODEL = {
-    'name': 'gpt-3.5-turbo',
-    'cost_per_1k': 0.0005,  # $0.0005 per 1K tokens
-    'type': 'cheap'
-}
-
-STRONG_MODEL = {
-    'name': 'gpt-4',
-    'cost_per_1k': 0.003,   # $0.003 per 1K tokens
-    'type': 'strong'
-}
+CHEAP_MODEL = ModelConfig(
+    name='gpt-3.5-turbo',
+    cost_per_1k=0.0005,  # $0.0005 per 1K tokens
+    type='cheap'
+)
+
+STRONG_MODEL = ModelConfig(
+    name='gpt-4',
+    cost_per_1k=0.003,   # $0.003 per 1K tokens
+    type='strong'
+)
 
 # Budget settings
 DAILY_BUDGET = 10.0  # $10 daily budget limit
 
+# Cache settings
+MAX_CACHE_ENTRIES = 10000  # Least recently used entries are evicted beyond this
+L1_CACHE_ENTRIES = 256     # Hot tier in front of the main cache
+
 # Token estimation settings
 TOKEN_MULTIPLIER = 1.3  # Heuristic: tokens ≈ 1.3 × words
 MAX_TOKENS = 2000  # Maximum safe token threshold for LONG classification
@@ -31,20 +47,43 @@ SIMPLE_THRESHOLD = 10        # Word count <= this is SIMPLE
 MIN_ALPHA_RATIO = 0.3        # At least 30% alphabetic characters
 
 
-# Request classifications
-CLASSIFICATION_EMPTY = 'EMPTY'
-CLASSIFICATION_GARBAGE = 'GARBAGE'
-CLASSIFICATION_SIMPLE = 'SIMPLE'
-CLASSIFICATION_COMPLEX = 'COMPLEX'
-CLASSIFICATION_LONG = 'LONG'
+# Request classifications (ordered: everything below SIMPLE is rejected)
+class Classification(IntEnum):
+    EMPTY = 0
+    GARBAGE = 1
+    SIMPLE = 2
+    COMPLEX = 3
+    LONG = 4
+
+
+CLASSIFICATION_EMPTY = Classification.EMPTY
+CLASSIFICATION_GARBAGE = Classification.GARBAGE
+CLASSIFICATION_SIMPLE = Classification.SIMPLE
+CLASSIFICATION_COMPLEX = Classification.COMPLEX
+CLASSIFICATION_LONG = Classification.LONG
+
 
 # Decision types
-DECISION_PROCESSED = 'PROCESSED'
-DECISION_PROCESSED_WITH_WARNING = 'PROCESSED_WITH_WARNING'
-DECISION_REJECTED = 'REJECTED'
-DECISION_CACHE_HIT = 'CACHE_HIT'
+class Decision(IntEnum):
+    PROCESSED = 0
+    PROCESSED_WITH_WARNING = 1
+    REJECTED = 2
+    CACHE_HIT = 3
+
+
+DECISION_PROCESSED = Decision.PROCESSED
+DECISION_PROCESSED_WITH_WARNING = Decision.PROCESSED_WITH_WARNING
+DECISION_REJECTED = Decision.REJECTED
+DECISION_CACHE_HIT = Decision.CACHE_HIT
+
 
 # Status types
-STATUS_SUCCESS = 'SUCCESS'
-STATUS_WARNING = 'WARNING'
-STATUS_REJECTED = 'REJECTED'
+class Status(IntEnum):
+    SUCCESS = 0
+    WARNING = 1
+    REJECTED = 2
+
+
+STATUS_SUCCESS = Status.SUCCESS
+STATUS_WARNING = Status.WARNING
+STATUS_REJECTED = Status.REJECTED
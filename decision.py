@@ -3,64 +3,89 @@ Decision Module
 Contains all request classification and decision logic
 """
 
-from typing import Dict
-from datetime import datetime
-import re
+from typing import Dict, Tuple
+import time
 
 from . import config
 from .cache import CacheManager
 from .budget import BudgetManager
 from .model_router import ModelRouter
 
+# Prompts longer than this are truncated in request logs
+PROMPT_PREVIEW_LENGTH = 100
+
 
 class RequestClassifier:
     """Classifies incoming requests into categories"""
 
     @staticmethod
-    def classify(prompt: str) -> str:
+    def classify(
+        prompt: str,
+        *,
+        _min_alpha_ratio: float = config.MIN_ALPHA_RATIO,
+        _garbage_threshold: int = config.GARBAGE_THRESHOLD,
+        _simple_threshold: int = config.SIMPLE_THRESHOLD,
+        _max_tokens: int = config.MAX_TOKENS,
+        _token_multiplier: float = config.TOKEN_MULTIPLIER,
+        _EMPTY: config.Classification = config.CLASSIFICATION_EMPTY,
+        _GARBAGE: config.Classification = config.CLASSIFICATION_GARBAGE,
+        _SIMPLE: config.Classification = config.CLASSIFICATION_SIMPLE,
+        _COMPLEX: config.Classification = config.CLASSIFICATION_COMPLEX,
+        _LONG: config.Classification = config.CLASSIFICATION_LONG,
+    ) -> Tuple[config.Classification, int]:
         """
         Classify request into one of:
         EMPTY, GARBAGE, SIMPLE, COMPLEX, LONG
+
+        Returns (classification, estimated_tokens); the token estimate is
+        0 for inputs rejected before words are counted.
+
+        The keyword-only underscore arguments bind config values as
+        locals at definition time; callers should not pass them.
         """
 
         # 1️⃣ None or invalid type
         if prompt is None or not isinstance(prompt, str):
-            return config.CLASSIFICATION_EMPTY
+            return _EMPTY, 0
 
         trimmed = prompt.strip()
 
         # 2️⃣ Empty or whitespace
         if not trimmed:
-            return config.CLASSIFICATION_EMPTY
+            return _EMPTY, 0
 
-        # 3️⃣ Garbage: low alphabetic signal
-        alpha_count = sum(c.isalpha() for c in trimmed)
-        alpha_ratio = alpha_count / len(trimmed)
+        length = len(trimmed)
 
-        if alpha_ratio < config.MIN_ALPHA_RATIO:
-            return config.CLASSIFICATION_GARBAGE
+        # 3️⃣ Garbage: extremely short (O(1), checked before scanning)
+        if length <= _garbage_threshold:
+            return _GARBAGE, 0
 
-        # 4️⃣ Garbage: extremely short
-        if len(trimmed) <= config.GARBAGE_THRESHOLD:
-            return config.CLASSIFICATION_GARBAGE
+        # 4️⃣ Garbage: low alphabetic signal
+        alpha_count = sum(map(str.isalpha, trimmed))
+        alpha_ratio = alpha_count / length
+
+        if alpha_ratio < _min_alpha_ratio:
+            return _GARBAGE, 0
 
         # 5️⃣ Token estimation for length handling
         word_count = len(trimmed.split())
-        estimated_tokens = int(word_count * config.TOKEN_MULTIPLIER)
+        estimated_tokens = int(word_count * _token_multiplier)
 
-        if estimated_tokens > config.MAX_TOKENS:
-            return config.CLASSIFICATION_LONG
+        if estimated_tokens > _max_tokens:
+            return _LONG, estimated_tokens
 
         # 6️⃣ Simple vs complex
-        if word_count <= config.SIMPLE_THRESHOLD:
-            return config.CLASSIFICATION_SIMPLE
+        if word_count <= _simple_threshold:
+            return _SIMPLE, estimated_tokens
 
-        return config.CLASSIFICATION_COMPLEX
+        return _COMPLEX, estimated_tokens
 
 
 class DecisionEngine:
     """Main decision engine that orchestrates the routing pipeline"""
 
+    __slots__ = ('classifier', 'router', 'cache', 'budget', '_request_count')
+
     def __init__(self, daily_budget: float = config.DAILY_BUDGET):
         self.classifier = RequestClassifier()
         self.router = ModelRouter()
@@ -72,21 +97,19 @@ class DecisionEngine:
         """Process a request through the complete routing pipeline"""
 
         self._request_count += 1
-        timestamp = datetime.now().isoformat()
+        timestamp = time.time()
+        preview = self._preview(prompt)
 
-        # Step 1: Classification
-        classification = self.classifier.classify(prompt)
+        # Step 1: Classification (also yields the token estimate)
+        classification, tokens = self.classifier.classify(prompt)
 
         # Step 2: Reject empty / garbage
-        if classification in (
-            config.CLASSIFICATION_EMPTY,
-            config.CLASSIFICATION_GARBAGE,
-        ):
+        if classification < config.CLASSIFICATION_SIMPLE:
             return self._create_rejection_log(
                 timestamp=timestamp,
-                prompt=prompt,
+                preview=preview,
                 classification=classification,
-                reason=f"{classification} input detected",
+                reason=f"{classification.name} input detected",
                 decision=config.DECISION_REJECTED,
             )
 
@@ -95,50 +118,46 @@ class DecisionEngine:
         if cached:
             return self._create_cache_hit_log(
                 timestamp=timestamp,
-                prompt=prompt,
+                preview=preview,
                 classification=classification,
                 cached_data=cached,
             )
 
-        # Step 4: Token estimation
-        tokens = self.router.estimate_tokens(prompt)
-
-        # Step 5: Model selection
+        # Step 4: Model selection
         model_config, selection_reason = self.router.select_model(classification)
 
         if model_config is None:
             return self._create_rejection_log(
                 timestamp=timestamp,
-                prompt=prompt,
+                preview=preview,
                 classification=classification,
                 reason=selection_reason,
                 decision=config.DECISION_REJECTED,
             )
 
-        # Step 6: Cost estimation
+        # Step 5: Cost estimation
         cost = self.router.calculate_cost(tokens, model_config)
 
-        # Step 7: Budget enforcement
-        if not self.budget.can_afford(cost):
+        # Step 6: Budget enforcement (deducts on success)
+        if not self.budget.try_deduct(cost):
             return self._create_rejection_log(
                 timestamp=timestamp,
-                prompt=prompt,
+                preview=preview,
                 classification=classification,
                 reason="DAILY_BUDGET_EXCEEDED",
                 decision=config.DECISION_REJECTED,
                 tokens=tokens,
-                model=model_config["name"],
+                model=model_config.name,
                 estimated_cost=cost,
             )
 
-        # Step 8: Long prompt warning (graceful degradation)
+        # Step 7: Long prompt warning (graceful degradation)
         if classification == config.CLASSIFICATION_LONG:
-            self.budget.deduct(cost)
-            self.cache.set(prompt, tokens, model_config["name"], cost)
+            self.cache.set(prompt, tokens, model_config.name, cost)
 
             return self._create_warning_log(
                 timestamp=timestamp,
-                prompt=prompt,
+                preview=preview,
                 classification=classification,
                 tokens=tokens,
                 model=model_config,
@@ -146,13 +165,12 @@ class DecisionEngine:
                 reason=f"Extremely long prompt ({tokens} tokens)",
             )
 
-        # Step 9: Successful execution
-        self.budget.deduct(cost)
-        self.cache.set(prompt, tokens, model_config["name"], cost)
+        # Step 8: Successful execution
+        self.cache.set(prompt, tokens, model_config.name, cost)
 
         return self._create_success_log(
             timestamp=timestamp,
-            prompt=prompt,
+            preview=preview,
             classification=classification,
             tokens=tokens,
             model=model_config,
@@ -162,48 +180,57 @@ class DecisionEngine:
 
     # ---------- LOG HELPERS ----------
 
+    @staticmethod
+    def _preview(prompt: str) -> str:
+        """Truncated prompt for display in request logs"""
+        if not isinstance(prompt, str):
+            return ""
+        if len(prompt) <= PROMPT_PREVIEW_LENGTH:
+            return prompt
+        return prompt[:PROMPT_PREVIEW_LENGTH] + "..."
+
     def _create_success_log(
         self,
-        timestamp: str,
-        prompt: str,
-        classification: str,
+        timestamp: float,
+        preview: str,
+        classification: config.Classification,
         tokens: int,
-        model: Dict,
+        model: config.ModelConfig,
         cost: float,
         reason: str,
     ) -> Dict:
-        budget_stats = self.budget.get_stats()
+        remaining = self.budget.get_remaining()
 
         return {
             "timestamp": timestamp,
             "request_id": self._request_count,
-            "prompt": prompt[:100] + "..." if len(prompt) > 100 else prompt,
+            "prompt": preview,
             "classification": classification,
             "decision": config.DECISION_PROCESSED,
             "cache_hit": False,
             "tokens_estimated": tokens,
-            "model_selected": model["name"],
-            "model_type": model["type"],
+            "model_selected": model.name,
+            "model_type": model.type,
             "model_changed": False,
             "selection_reason": reason,
             "cost_estimated": round(cost, 6),
-            "remaining_budget": round(budget_stats["remaining"], 4),
+            "remaining_budget": round(remaining, 4),
             "status": config.STATUS_SUCCESS,
         }
 
     def _create_cache_hit_log(
         self,
-        timestamp: str,
-        prompt: str,
-        classification: str,
+        timestamp: float,
+        preview: str,
+        classification: config.Classification,
         cached_data: Dict,
     ) -> Dict:
-        cache_stats = self.cache.get_stats()
+        cost_saved = self.cache.get_cost_saved()
 
         return {
             "timestamp": timestamp,
             "request_id": self._request_count,
-            "prompt": prompt[:100] + "..." if len(prompt) > 100 else prompt,
+            "prompt": preview,
             "classification": classification,
             "decision": config.DECISION_CACHE_HIT,
             "cache_hit": True,
@@ -211,63 +238,63 @@ class DecisionEngine:
             "model_selected": cached_data["model"],
             "cost_estimated": 0.0,
             "cost_saved": round(cached_data["cost"], 6),
-            "total_cache_savings": round(cache_stats["cost_saved"], 4),
+            "total_cache_savings": round(cost_saved, 4),
             "selection_reason": "Exact cache match – zero cost",
             "status": config.STATUS_SUCCESS,
         }
 
     def _create_rejection_log(
         self,
-        timestamp: str,
-        prompt: str,
-        classification: str,
+        timestamp: float,
+        preview: str,
+        classification: config.Classification,
         reason: str,
-        decision: str,
+        decision: config.Decision,
         tokens: int = 0,
         model: str = "None",
         estimated_cost: float = 0.0,
     ) -> Dict:
-        budget_stats = self.budget.get_stats()
+        remaining = self.budget.get_remaining()
 
         return {
             "timestamp": timestamp,
             "request_id": self._request_count,
-            "prompt": prompt[:100] + "..." if prompt else "",
+            "prompt": preview,
             "classification": classification,
             "decision": decision,
             "cache_hit": False,
             "tokens_estimated": tokens,
             "model_selected": model,
             "cost_estimated": round(estimated_cost, 6),
-            "remaining_budget": round(budget_stats["remaining"], 4),
+            "remaining_budget": round(remaining, 4),
             "rejection_reason": reason,
             "status": config.STATUS_REJECTED,
         }
 
     def _create_warning_log(
         self,
-        timestamp: str,
-        prompt: str,
-        classification: str,
+        timestamp: float,
+        preview: str,
+        classification: config.Classification,
         tokens: int,
-        model: Dict,
+        model: config.ModelConfig,
         cost: float,
         reason: str,
     ) -> Dict:
-        budget_stats = self.budget.get_stats()
+        remaining = self.budget.get_remaining()
 
         return {
             "timestamp": timestamp,
             "request_id": self._request_count,
-            "prompt": prompt[:100] + "..." if len(prompt) > 100 else prompt,
+            "prompt": preview,
             "classification": classification,
             "decision": config.DECISION_PROCESSED_WITH_WARNING,
             "cache_hit": False,
             "tokens_estimated": tokens,
-            "model_selected": model["name"],
-            "model_type": model["type"],
+            "model_selected": model.name,
+            "model_type": model.type,
             "cost_estimated": round(cost, 6),
-            "remaining_budget": round(budget_stats["remaining"], 4),
+            "remaining_budget": round(remaining, 4),
             "warning_reason": reason,
             "status": config.STATUS_WARNING,
         }
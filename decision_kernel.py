@@ -0,0 +1,167 @@
+"""
+Decision Kernel Module
+Native (Numba) classification kernel for bulk request processing
+"""
+
+from itertools import accumulate
+from typing import List, Tuple
+
+from . import config
+from .decision import RequestClassifier
+
+try:
+    import numpy as np
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional speedup
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in so the kernels stay importable without Numba"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Kernel return codes are Classification values, indexed into this tuple
+_CODE_TO_CLASSIFICATION = tuple(config.Classification)
+
+
+@njit(cache=True)
+def _is_space(c) -> bool:
+    """ASCII whitespace as understood by str.isspace()"""
+    return c == 32 or 9 <= c <= 13 or 28 <= c <= 31
+
+
+@njit(cache=True)
+def _is_alpha(c) -> bool:
+    """ASCII letter"""
+    return 65 <= c <= 90 or 97 <= c <= 122
+
+
+@njit(cache=True)
+def _classify_bytes(buf, start, end, min_alpha_ratio, garbage_thresh,
+                    simple_thresh, max_tokens, token_mult):
+    """
+    Classify the ASCII prompt stored in buf[start:end] in a single pass
+
+    Mirrors RequestClassifier.classify step for step.
+
+    Returns:
+        Tuple of (index into _CODE_TO_CLASSIFICATION, estimated_tokens)
+    """
+    while start < end and _is_space(buf[start]):
+        start += 1
+    while end > start and _is_space(buf[end - 1]):
+        end -= 1
+
+    length = end - start
+    if length == 0:
+        return 0, 0
+    if length <= garbage_thresh:
+        return 1, 0
+
+    alpha_count = 0
+    word_count = 0
+    in_word = False
+    for i in range(start, end):
+        c = buf[i]
+        if _is_space(c):
+            in_word = False
+        else:
+            if not in_word:
+                word_count += 1
+                in_word = True
+            if _is_alpha(c):
+                alpha_count += 1
+
+    if alpha_count / length < min_alpha_ratio:
+        return 1, 0
+
+    estimated_tokens = int(word_count * token_mult)
+    if estimated_tokens > max_tokens:
+        return 4, estimated_tokens
+
+    if word_count <= simple_thresh:
+        return 2, estimated_tokens
+
+    return 3, estimated_tokens
+
+
+@njit(parallel=True, cache=True)
+def _classify_batch_bytes(buf, offsets, min_alpha_ratio, garbage_thresh,
+                          simple_thresh, max_tokens, token_mult):
+    """Classify every prompt packed into buf, delimited by offsets"""
+    n = len(offsets) - 1
+    codes = np.empty(n, np.int8)
+    tokens = np.empty(n, np.int64)
+    for i in prange(n):
+        codes[i], tokens[i] = _classify_bytes(
+            buf, offsets[i], offsets[i + 1], min_alpha_ratio,
+            garbage_thresh, simple_thresh, max_tokens, token_mult
+        )
+    return codes, tokens
+
+
+def classify(prompt: str) -> Tuple[config.Classification, int]:
+    """
+    Classify a single request, using the native kernel when possible
+
+    Args:
+        prompt: Input prompt
+
+    Returns:
+        Tuple of (classification, estimated_tokens)
+    """
+    if not NUMBA_AVAILABLE or not isinstance(prompt, str) or not prompt.isascii():
+        return RequestClassifier.classify(prompt)
+
+    buf = np.frombuffer(prompt.encode(), dtype=np.uint8)
+    code, tokens = _classify_bytes(
+        buf, 0, len(buf), config.MIN_ALPHA_RATIO, config.GARBAGE_THRESHOLD,
+        config.SIMPLE_THRESHOLD, config.MAX_TOKENS, config.TOKEN_MULTIPLIER
+    )
+    return _CODE_TO_CLASSIFICATION[code], int(tokens)
+
+
+def classify_batch(prompts: List[str]) -> List[Tuple[config.Classification, int]]:
+    """
+    Classify many requests at once
+
+    ASCII prompts are classified in parallel by the native kernel; anything
+    else (None, non-str, non-ASCII text) goes through the Python classifier.
+
+    Args:
+        prompts: Input prompts
+
+    Returns:
+        (classification, estimated_tokens) tuples, in input order
+    """
+    if not NUMBA_AVAILABLE:
+        return [RequestClassifier.classify(p) for p in prompts]
+
+    results: List[Tuple[config.Classification, int]] = [None] * len(prompts)
+    native_idx = []
+    encoded = []
+    for i, prompt in enumerate(prompts):
+        if isinstance(prompt, str) and prompt.isascii():
+            native_idx.append(i)
+            encoded.append(prompt.encode())
+        else:
+            results[i] = RequestClassifier.classify(prompt)
+
+    if encoded:
+        buf = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+        offsets = np.fromiter(
+            accumulate((len(b) for b in encoded), initial=0),
+            dtype=np.int64, count=len(encoded) + 1
+        )
+        codes, tokens = _classify_batch_bytes(
+            buf, offsets, config.MIN_ALPHA_RATIO, config.GARBAGE_THRESHOLD,
+            config.SIMPLE_THRESHOLD, config.MAX_TOKENS, config.TOKEN_MULTIPLIER
+        )
+        for i, code, estimate in zip(native_idx, codes, tokens):
+            results[i] = (_CODE_TO_CLASSIFICATION[code], int(estimate))
+
+    return results
@@ -3,15 +3,18 @@ Model Router Module
 Handles model selection and cost calculation
 """
 
-from typing import Tuple, Dict
+from typing import Optional, Tuple
 from . import config
 
+# Classifications routed to the strong model
+_STRONG_CLASSES = frozenset({config.CLASSIFICATION_COMPLEX, config.CLASSIFICATION_LONG})
+
 
 class ModelRouter:
     """Handles model selection based on request classification"""
     
     @staticmethod
-    def select_model(classification: str) -> Tuple[Dict, str]:
+    def select_model(classification: config.Classification) -> Tuple[Optional[config.ModelConfig], str]:
         """
         Select appropriate model based on request classification
         
@@ -26,25 +29,25 @@ class ModelRouter:
                 config.CHEAP_MODEL,
                 'Simple query - using cost-efficient model'
             )
-        elif classification in [config.CLASSIFICATION_COMPLEX, config.CLASSIFICATION_LONG]:
+        elif classification in _STRONG_CLASSES:
             return (
                 config.STRONG_MODEL,
-                f'{classification.title()} query - requires advanced model'
+                f'{classification.name.title()} query - requires advanced model'
             )
         else:
             return (
                 None,
-                f'Invalid classification: {classification}'
+                f'Invalid classification: {getattr(classification, "name", classification)}'
             )
     
     @staticmethod
-    def calculate_cost(tokens: int, model_config: Dict) -> float:
+    def calculate_cost(tokens: int, model_config: Optional[config.ModelConfig]) -> float:
         """
         Calculate cost based on tokens and model
         
         Args:
             tokens: Estimated token count
-            model_config: Model configuration dict
+            model_config: Model configuration
             
         Returns:
             Estimated cost in dollars
@@ -52,22 +55,24 @@ class ModelRouter:
         if model_config is None:
             return 0.0
         
-        cost_per_1k = model_config.get('cost_per_1k', 0.0)
-        return (tokens / 1000) * cost_per_1k
+        return (tokens / 1000) * model_config.cost_per_1k
     
     @staticmethod
     def estimate_tokens(prompt: str) -> int:
         """
         Estimate tokens using heuristic
         
+        Not used on the request path: RequestClassifier.classify already
+        returns this estimate. Kept for external callers.
+        
         Args:
             prompt: Input text
             
         Returns:
             Estimated token count
         """
-        if not prompt or not prompt.strip():
+        if not prompt:
             return 0
         
-        word_count = len(prompt.strip().split())
+        word_count = len(prompt.split())
         return int(word_count * config.TOKEN_MULTIPLIER)